@@ -0,0 +1,46 @@
+# cython: language_level=3
+"""Compiled phone number normalization used by contact_manager when built"""
+
+
+cdef extern from "Python.h":
+    int PyUnicode_4BYTE_KIND
+    object PyUnicode_FromKindAndData(int kind, const void *buffer, Py_ssize_t size)
+
+
+cpdef str normalize(str phone):
+    """Normalize phone number to +1-XXX-XXX-XXXX format"""
+    cdef Py_UCS4 digits[11]
+    cdef Py_UCS4 out[15]
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t start, i
+    cdef Py_UCS4 ch
+
+    # Collect the digits in a single pass, bailing out once there are too many
+    for ch in phone:
+        if ch.isdecimal():
+            if count == 11:
+                return phone
+            digits[count] = ch
+            count += 1
+
+    # Ensure we have 10 digits, optionally after a leading country code
+    if count == 10:
+        start = 0
+    elif count == 11 and digits[0] == u"1":
+        start = 1
+    else:
+        # Return original if we can't normalize
+        return phone
+
+    out[0] = u"+"
+    out[1] = u"1"
+    out[2] = u"-"
+    for i in range(3):
+        out[3 + i] = digits[start + i]
+    out[6] = u"-"
+    for i in range(3):
+        out[7 + i] = digits[start + 3 + i]
+    out[10] = u"-"
+    for i in range(4):
+        out[11 + i] = digits[start + 6 + i]
+    return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, out, 15)
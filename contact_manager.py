@@ -1,32 +1,156 @@
-import json
+import argparse
+import collections
+import contextlib
+import functools
+import itertools
+import os
 import re
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import ijson
 import pymysql
 
+# Number of contacts sent to the database per insert during JSON imports
+_IMPORT_BATCH_SIZE = 1000
+
+# Secondary indexes that let lookups by name or email skip the row read
+_COVERING_INDEXES = {
+    "idx_name_covering": "(name, id, email, phone)",
+    "idx_email_covering": "(email, name, phone)",
+}
+
+# Lookup statements for each supported query type
+_FIND_SQL = {
+    "name": "SELECT name, email, phone FROM contacts WHERE name = %s",
+    "email": "SELECT name, email, phone FROM contacts WHERE email = %s",
+}
+_UPDATE_PHONE_SQL = {
+    "name": "UPDATE contacts SET phone = %s WHERE name = %s",
+    "email": "UPDATE contacts SET phone = %s WHERE email = %s",
+}
+_DELETE_SQL = {
+    "name": "DELETE FROM contacts WHERE name = %s",
+    "email": "DELETE FROM contacts WHERE email = %s",
+}
+
+# Insert that skips existing emails (rowcount 0) without the blanket error
+# downgrading of INSERT IGNORE, so rows with missing or oversized fields fail
+_INSERT_SQL = (
+    "INSERT INTO contacts (name, email, phone) VALUES (%s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE email = email"
+)
+
+# Deadlock and lock wait timeout errors, and how often a parallel import
+# batch that hits one is retried
+_LOCK_ERRORS = (1205, 1213)
+_LOCK_RETRIES = 3
+
+# Imports larger than this switch from batched INSERTs to LOAD DATA
+_LOAD_DATA_THRESHOLD = 50000
+
+# Maximum lengths of the name, email and phone columns
+_COLUMN_WIDTHS = (100, 100, 20)
+
+# Characters LOAD DATA treats specially inside a field, with their escapes
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_TSV_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+_TSV_ESCAPE_RE = re.compile(r"\\(.)")
+
+# Errors from servers that refuse LOAD DATA LOCAL (local_infile=OFF)
+_LOCAL_INFILE_DISABLED = (1148, 3948)
+
+_NON_DIGIT_RE = re.compile(r"\D")
+# Translation table deleting every non-digit ASCII character
+_STRIP_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+
+
+# Imports often repeat the same phone strings, so skip recomputing them
+@functools.lru_cache(maxsize=65536)
+def _normalize_phone(phone):
+    """Normalize phone number to +1-XXX-XXX-XXXX format"""
+    # Remove any non-digit characters
+    digits = phone.translate(_STRIP_NON_DIGITS)
+    if not digits.isascii():
+        # Non-ASCII characters survive the table, fall back to the regex
+        digits = _NON_DIGIT_RE.sub("", phone)
+
+    # Drop the leading country code so both formats share one branch
+    if len(digits) == 11 and digits[0] == "1":
+        digits = digits[1:]
+
+    # Ensure we have 10 digits (assuming US format)
+    if len(digits) == 10:
+        return f"+1-{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+    else:
+        # Return original if we can't normalize
+        return phone
+
+
+try:
+    # Compiled drop-in replacement, see the README for how to build it
+    from _phone import normalize as _normalize_phone
+except ImportError:
+    pass
+
+
+def _build_row(contact_data):
+    """Build a (name, email, phone) insert row from a JSON contact record"""
+    return (
+        contact_data.get("name"),
+        contact_data.get("email"),
+        _normalize_phone(contact_data.get("phone")),
+    )
+
+
+def _fits_columns(row):
+    """Check that every field of an insert row is present and fits its column"""
+    return all(
+        value is not None and len(str(value)) <= width
+        for value, width in zip(row, _COLUMN_WIDTHS)
+    )
+
+
+def _tsv_line(row):
+    """Format an insert row as a line for LOAD DATA with its default escaping"""
+    return "\t".join(str(value).translate(_TSV_ESCAPES) for value in row) + "\n"
+
+
+def _parse_tsv_line(line):
+    """Turn a line written by _tsv_line back into an insert row"""
+    return tuple(
+        _TSV_ESCAPE_RE.sub(lambda m: _TSV_UNESCAPES[m.group(1)], field)
+        for field in line.rstrip("\n").split("\t")
+    )
+
+
+def _batched(rows):
+    """Group insert rows into lists of _IMPORT_BATCH_SIZE"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= _IMPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
 class Contact:
     """Contact Class"""
 
+    __slots__ = ("name", "email", "phone")
+
     def __init__(self, name, email, phone):
         self.name = name
         self.email = email
         self.phone = self.normalize_phone(phone)
 
-    @staticmethod
-    def normalize_phone(phone):
-        """Normalize phone number to +1-XXX-XXX-XXXX format"""
-        # Remove any non-digit characters
-        digits = re.sub(r"\D", "", phone)
-
-        # Ensure we have 10 digits (assuming US format)
-        if len(digits) == 10:
-            return f"+1-{digits[:3]}-{digits[3:6]}-{digits[6:]}"
-        elif len(digits) == 11 and digits[0] == "1":
-            return f"+1-{digits[1:4]}-{digits[4:7]}-{digits[7:]}"
-        else:
-            # Return original if we can't normalize
-            return phone
+    normalize_phone = staticmethod(_normalize_phone)
 
 
 class ContactManager:
@@ -35,15 +159,21 @@ class ContactManager:
     def __init__(
         self, host="localhost", user="root", password="", db_name="contact_database"
     ):
+        # Set up front so close() works even if connecting fails
+        self.connection = None
+        self._cursor = None
+        self._dict_cursor = None
+
         try:
             # Connect to MySQL server
-            self.connection = pymysql.connect(
+            self._connect_args = dict(
                 host=host,
                 user=user,
                 password=password,
                 charset="utf8mb4",
-                cursorclass=pymysql.cursors.DictCursor,
+                autocommit=False,
             )
+            self.connection = pymysql.connect(**self._connect_args)
 
             # Create database if it doesn't exist
             with self.connection.cursor() as cursor:
@@ -51,6 +181,7 @@ class ContactManager:
 
             # Connect to the database
             self.connection.select_db(db_name)
+            self._connect_args["database"] = db_name
 
             # Create contacts table if it doesn't exist
             with self.connection.cursor() as cursor:
@@ -61,80 +192,316 @@ class ContactManager:
                         name VARCHAR(100) NOT NULL,
                         email VARCHAR(100) NOT NULL UNIQUE,
                         phone VARCHAR(20) NOT NULL,
-                        INDEX (name)
+                        INDEX idx_name_covering (name, id, email, phone),
+                        INDEX idx_email_covering (email, name, phone)
                     )
                 """
                 )
                 self.connection.commit()
 
+            # Upgrade tables created before the covering indexes existed
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT DISTINCT index_name
+                    FROM information_schema.statistics
+                    WHERE table_schema = DATABASE() AND table_name = 'contacts'
+                """
+                )
+                existing = {row[0] for row in cursor.fetchall()}
+                for index_name, columns in _COVERING_INDEXES.items():
+                    if index_name not in existing:
+                        cursor.execute(
+                            f"ALTER TABLE contacts ADD INDEX {index_name} {columns}"
+                        )
+                # The old single-column name index is a prefix of the new one
+                if "name" in existing:
+                    cursor.execute("ALTER TABLE contacts DROP INDEX name")
+
+            # Reuse cursors instead of opening one per call. Writes use a plain
+            # cursor, reads use a dict cursor since callers index rows by column
+            self._cursor = self.connection.cursor()
+            self._dict_cursor = self.connection.cursor(pymysql.cursors.DictCursor)
+
             print("Successfully connected to MySQL database")
         except Exception as e:
             print(f"Error connecting to database: {e}")
             sys.exit(1)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __del__(self):
-        """Close the database connection"""
-        if hasattr(self, "connection"):
+        """Close the database connection if close() was never called"""
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Close the cursors and the database connection"""
+        for cursor in (self._cursor, self._dict_cursor):
+            if cursor is not None:
+                cursor.close()
+        self._cursor = self._dict_cursor = None
+
+        if self.connection is not None:
             self.connection.close()
+            self.connection = None
 
-    def add_contacts_from_json(self, json_file):
-        """Add contacts from JSON file"""
+    def add_contacts_from_json(self, json_file, workers=1):
+        """Add contacts from JSON file, using parallel connections if workers > 1"""
+        # Returns the number of new contacts, or None if the import failed
         try:
-            with open(json_file, "r") as f:
-                data = json.load(f)
-                contacts = data.get("contacts", [])
-
-            print(f"Found {len(contacts)} contacts in JSON file")
-
+            found = 0
             successful_imports = 0
 
-            for contact_data in contacts:
-                contact = Contact(
-                    contact_data.get("name"),
-                    contact_data.get("email"),
-                    contact_data.get("phone"),
-                )
-                result = self.add_contact(contact)
-                if result is not None:
-                    successful_imports += 1
+            # Stream the contacts array so only a few batches are held in memory
+            with open(json_file, "rb") as f:
+                batches = _batched(map(_build_row, ijson.items(f, "contacts.item")))
+                if workers > 1:
+                    found, successful_imports = self._insert_batches_parallel(
+                        batches, workers
+                    )
+                else:
+                    found, successful_imports = self._insert_batches(batches)
 
+            print(f"Found {found} contacts in JSON file")
+            skipped = found - successful_imports
+            if skipped:
+                print(f"Skipped {skipped} duplicate or invalid contacts")
             print(f"Successfully imported {successful_imports} contacts")
             return successful_imports
         except FileNotFoundError:
             print(f"JSON file {json_file} not found")
-            return 0
-        except json.JSONDecodeError:
+            return None
+        except ijson.JSONError:
             print(f"Error parsing JSON file {json_file}")
-            return 0
+            return None
         except Exception as e:
             print(f"Error importing contacts: {e}")
-            return 0
+            return None
+
+    def _insert_batches(self, batches):
+        """Insert batches in one transaction on a dedicated import connection"""
+        # Only this connection may serve LOAD DATA LOCAL file requests, so the
+        # interactive and worker connections can't be asked for client files
+        connection = pymysql.connect(**self._connect_args, local_infile=True)
+        try:
+            found = 0
+            inserted = 0
+            with connection.cursor() as cursor:
+                connection.begin()
+                for batch in batches:
+                    if found + len(batch) > _LOAD_DATA_THRESHOLD:
+                        # Large file, hand the rest to the server's bulk loader
+                        loaded, loaded_inserted = self._load_batches(
+                            itertools.chain([batch], batches), cursor
+                        )
+                        found += loaded
+                        inserted += loaded_inserted
+                        break
+                    found += len(batch)
+                    inserted += self._insert_batch(batch, cursor)
+            connection.commit()
+            self._end_read_transaction()
+            return found, inserted
+        except Exception:
+            self._rollback(connection)
+            raise
+        finally:
+            connection.close()
+
+    def _insert_batches_parallel(self, batches, workers):
+        """Insert batches from a thread pool, one connection per worker"""
+        # Each batch commits on its own, so a failure part way through leaves
+        # the batches that already finished imported
+        local = threading.local()
+        connections = []
+        committed = [0]
+        committed_lock = threading.Lock()
+
+        def insert(rows):
+            connection = getattr(local, "connection", None)
+            if connection is None:
+                connection = local.connection = pymysql.connect(**self._connect_args)
+                connections.append(connection)
+            for attempt in range(_LOCK_RETRIES + 1):
+                try:
+                    with connection.cursor() as cursor:
+                        inserted = self._insert_batch(rows, cursor)
+                    connection.commit()
+                    break
+                except pymysql.err.OperationalError as e:
+                    # Concurrent batches with shared emails can deadlock on the
+                    # unique index, so retry the batch when InnoDB gives up
+                    if e.args[0] not in _LOCK_ERRORS or attempt == _LOCK_RETRIES:
+                        raise
+                    connection.rollback()
+            with committed_lock:
+                committed[0] += inserted
+
+        found = 0
+        pending = collections.deque()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch in batches:
+                    found += len(batch)
+                    pending.append(executor.submit(insert, batch))
+                    # Wait on the oldest batch so parsing can't run far ahead
+                    if len(pending) >= 2 * workers:
+                        pending.popleft().result()
+                while pending:
+                    pending.popleft().result()
+        except Exception:
+            print(f"{committed[0]} contacts were committed before the import failed")
+            raise
+        finally:
+            for connection in connections:
+                connection.close()
+            # Batches may have committed even if the import failed part way
+            self._end_read_transaction()
+        return found, committed[0]
+
+    def _rollback(self, connection):
+        """Roll back the current transaction, tolerating a dropped connection"""
+        try:
+            connection.rollback()
+        except Exception as e:
+            print(f"Error rolling back changes: {e}")
+
+    def _end_read_transaction(self):
+        """Drop the main connection's read snapshot after another connection commits"""
+        # Writes on the main connection commit straight away, so this only ends
+        # the REPEATABLE READ snapshot an earlier SELECT left open, which would
+        # otherwise hide the imported contacts from later reads
+        try:
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error refreshing the database connection: {e}")
+
+    def flush(self):
+        """Commit pending changes to the database"""
+        self.connection.commit()
 
     def add_contact(self, contact):
         """Add a new contact to the database"""
         try:
-            with self.connection.cursor() as cursor:
-                sql = "INSERT INTO contacts (name, email, phone) VALUES (%s, %s, %s)"
-                cursor.execute(sql, (contact.name, contact.email, contact.phone))
-                self.connection.commit()
-                return cursor.lastrowid
-        except pymysql.err.IntegrityError as e:
-            if "Duplicate entry" in str(e):
+            cursor = self._cursor
+            cursor.execute(_INSERT_SQL, (contact.name, contact.email, contact.phone))
+            self.flush()
+
+            # A no-op duplicate key update means the email is already taken
+            if cursor.rowcount == 0:
                 print(f"Contact with email {contact.email} already exists")
-            else:
-                print(f"Database integrity error: {e}")
+                return None
+            return cursor.lastrowid
+        except pymysql.err.IntegrityError as e:
+            print(f"Database integrity error: {e}")
             return None
         except Exception as e:
             print(f"Error adding contact: {e}")
             return None
 
+    def _load_batches(self, batches, cursor):
+        """Bulk load batches of rows through a temporary TSV file without committing"""
+        found = 0
+        inserted = 0
+        tsv = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", newline="\n", suffix=".tsv", delete=False
+        )
+        # Remove the spool file however the write or the load ends
+        try:
+            with tsv:
+                for batch in batches:
+                    found += len(batch)
+                    # LOAD DATA LOCAL downgrades bad values to warnings, so send
+                    # rows that would be coerced through the INSERT path instead
+                    invalid = [row for row in batch if not _fits_columns(row)]
+                    if invalid:
+                        inserted += self._insert_batch(invalid, cursor)
+                    tsv.writelines(
+                        _tsv_line(row) for row in batch if _fits_columns(row)
+                    )
+
+            sql = (
+                "LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE contacts "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+                "(name, email, phone)"
+            )
+            try:
+                cursor.execute(sql, (tsv.name,))
+                inserted += cursor.rowcount
+            except pymysql.err.OperationalError as e:
+                if e.args[0] not in _LOCAL_INFILE_DISABLED:
+                    raise
+                # The server refuses local files, insert the spooled rows instead
+                with open(tsv.name, encoding="utf-8", newline="\n") as spooled:
+                    for batch in _batched(map(_parse_tsv_line, spooled)):
+                        inserted += self._insert_batch(batch, cursor)
+        finally:
+            os.remove(tsv.name)
+
+        return found, inserted
+
+    def _insert_batch(self, rows, cursor):
+        """Insert a batch of (name, email, phone) rows without committing"""
+        if not rows:
+            return 0
+
+        try:
+            cursor.executemany(_INSERT_SQL, rows)
+            # Skipped duplicates are not counted in rowcount
+            return cursor.rowcount
+        except (pymysql.err.IntegrityError, pymysql.err.DataError):
+            # Only the failed statement is undone, so retry row by row to
+            # import the valid contacts and report the invalid ones
+            inserted = 0
+            for row in rows:
+                try:
+                    inserted += cursor.execute(_INSERT_SQL, row)
+                except (pymysql.err.IntegrityError, pymysql.err.DataError) as e:
+                    print(f"Could not add contact {row[1]}: {e}")
+            return inserted
+
     def get_all_contacts(self):
         """Retrieve all contacts from the database"""
+        return list(self.get_all_contacts_stream())
+
+    def get_all_contacts_stream(self, chunk=1000):
+        """Yield all contacts, fetching them from the server one page at a time"""
+        after = None
+        while True:
+            contacts = self.get_contacts_page(after, chunk)
+            yield from contacts
+            if len(contacts) < chunk:
+                break
+            after = (contacts[-1]["name"], contacts[-1]["id"])
+
+    def get_contacts_page(self, after=None, limit=500):
+        """Retrieve a page of contacts ordered by name after a (name, id) key"""
         try:
-            with self.connection.cursor() as cursor:
-                sql = "SELECT name, email, phone FROM contacts ORDER BY name"
-                cursor.execute(sql)
-                return cursor.fetchall()
+            cursor = self._dict_cursor
+            # Keyset pagination walks the (name, id) index instead of sorting
+            if after is None:
+                sql = (
+                    "SELECT id, name, email, phone FROM contacts "
+                    "ORDER BY name, id LIMIT %s"
+                )
+                cursor.execute(sql, (limit,))
+            else:
+                sql = (
+                    "SELECT id, name, email, phone FROM contacts "
+                    "WHERE name > %s OR (name = %s AND id > %s) "
+                    "ORDER BY name, id LIMIT %s"
+                )
+                name, contact_id = after
+                cursor.execute(sql, (name, name, contact_id, limit))
+            return cursor.fetchall()
         except Exception as e:
             print(f"Error retrieving contacts: {e}")
             return []
@@ -142,14 +509,14 @@ class ContactManager:
     def find_contact(self, query_type, query_value):
         """Find a contact by name or email"""
         try:
-            if query_type not in ["name", "email"]:
+            sql = _FIND_SQL.get(query_type)
+            if sql is None:
                 print("Invalid query type. Use 'name' or 'email'")
                 return None
 
-            with self.connection.cursor() as cursor:
-                sql = f"SELECT name, email, phone FROM contacts WHERE {query_type} = %s"
-                cursor.execute(sql, (query_value,))
-                return cursor.fetchone()
+            cursor = self._dict_cursor
+            cursor.execute(sql, (query_value,))
+            return cursor.fetchone()
         except Exception as e:
             print(f"Error finding contact: {e}")
             return None
@@ -157,22 +524,22 @@ class ContactManager:
     def update_phone(self, query_type, query_value, new_phone):
         """Update phone number for a specific contact"""
         try:
-            if query_type not in ["name", "email"]:
+            sql = _UPDATE_PHONE_SQL.get(query_type)
+            if sql is None:
                 print("Invalid query type. Use 'name' or 'email'")
                 return False
 
             # Normalize the phone number
             normalized_phone = Contact.normalize_phone(new_phone)
 
-            with self.connection.cursor() as cursor:
-                sql = f"UPDATE contacts SET phone = %s WHERE {query_type} = %s"
-                result = cursor.execute(sql, (normalized_phone, query_value))
-                self.connection.commit()
+            cursor = self._cursor
+            result = cursor.execute(sql, (normalized_phone, query_value))
+            self.flush()
 
-                if result == 0:
-                    print(f"No contact found with {query_type}: {query_value}")
-                    return False
-                return True
+            if result == 0:
+                print(f"No contact found with {query_type}: {query_value}")
+                return False
+            return True
         except Exception as e:
             print(f"Error updating contact: {e}")
             return False
@@ -180,19 +547,19 @@ class ContactManager:
     def delete_contact(self, query_type, query_value):
         """Delete a contact by name or email"""
         try:
-            if query_type not in ["name", "email"]:
+            sql = _DELETE_SQL.get(query_type)
+            if sql is None:
                 print("Invalid query type. Use 'name' or 'email'")
                 return False
 
-            with self.connection.cursor() as cursor:
-                sql = f"DELETE FROM contacts WHERE {query_type} = %s"
-                result = cursor.execute(sql, (query_value,))
-                self.connection.commit()
+            cursor = self._cursor
+            result = cursor.execute(sql, (query_value,))
+            self.flush()
 
-                if result == 0:
-                    print(f"No contact found with {query_type}: {query_value}")
-                    return False
-                return True
+            if result == 0:
+                print(f"No contact found with {query_type}: {query_value}")
+                return False
+            return True
         except Exception as e:
             print(f"Error deleting contact: {e}")
             return False
@@ -212,17 +579,115 @@ def display_menu():
     return input("Enter your choice (1-7): ")
 
 
-def main():
-    """TO RUN MY CODE PLEASE INPUT THE CORRECT DETAILS BELOW"""
-    manager = ContactManager(
-        host="localhost",
-        user="root",
-        password="",
-        db_name="contact_database",
+# Command mode
+def build_parser():
+    """Build the parser for non-interactive commands"""
+    parser = argparse.ArgumentParser(
+        description="Manage contacts stored in MySQL. Run without a command "
+        "for the interactive menu."
     )
+    subparsers = parser.add_subparsers(dest="command")
+
+    import_parser = subparsers.add_parser("import", help="import contacts from JSON")
+    import_parser.add_argument("json_file", nargs="?", default="contact_list.json")
+    import_parser.add_argument(
+        "--workers", type=int, default=1, help="parallel connections for the import"
+    )
+
+    add_parser = subparsers.add_parser("add", help="add a new contact")
+    add_parser.add_argument("name")
+    add_parser.add_argument("email")
+    add_parser.add_argument("phone")
+
+    subparsers.add_parser("list", help="show all contacts")
+
+    find_parser = subparsers.add_parser("find", help="find a contact")
+    find_parser.add_argument("query_type", choices=["name", "email"])
+    find_parser.add_argument("query_value")
+
+    update_parser = subparsers.add_parser("update", help="update a phone number")
+    update_parser.add_argument("query_type", choices=["name", "email"])
+    update_parser.add_argument("query_value")
+    update_parser.add_argument("new_phone")
+
+    delete_parser = subparsers.add_parser("delete", help="delete a contact")
+    delete_parser.add_argument("query_type", choices=["name", "email"])
+    delete_parser.add_argument("query_value")
+
+    return parser
+
+
+def run_command(manager, args, output):
+    """Run a single parsed command and return the process exit code"""
+    if args.command == "import":
+        result = manager.add_contacts_from_json(args.json_file, workers=args.workers)
+        return 1 if result is None else 0
+
+    if args.command == "add":
+        result = manager.add_contact(Contact(args.name, args.email, args.phone))
+        return 0 if result else 1
+
+    if args.command == "list":
+        for contact in manager.get_all_contacts_stream():
+            print(
+                f"{contact['name']}\t{contact['email']}\t{contact['phone']}",
+                file=output,
+            )
+        return 0
+
+    if args.command == "find":
+        contact = manager.find_contact(args.query_type, args.query_value)
+        if not contact:
+            print(f"No contact found with {args.query_type}: {args.query_value}")
+            return 1
+        print(
+            f"{contact['name']}\t{contact['email']}\t{contact['phone']}", file=output
+        )
+        return 0
+
+    if args.command == "update":
+        success = manager.update_phone(
+            args.query_type, args.query_value, args.new_phone
+        )
+        return 0 if success else 1
+
+    if args.command == "delete":
+        success = manager.delete_contact(args.query_type, args.query_value)
+        return 0 if success else 1
+
+
+def main(argv=None):
+    """TO RUN MY CODE PLEASE INPUT THE CORRECT DETAILS BELOW"""
+    args = build_parser().parse_args(argv)
+
+    # In command mode stdout carries only the command's output for scripts,
+    # so connection and other status messages go to stderr
+    output = sys.stdout
+    if args.command:
+        status = contextlib.redirect_stdout(sys.stderr)
+    else:
+        status = contextlib.nullcontext()
+
+    with status:
+        manager = ContactManager(
+            host="localhost",
+            user="root",
+            password="",
+            db_name="contact_database",
+        )
+
+    if args.command:
+        with manager, status:
+            return run_command(manager, args, output)
+
+    # Only draw the menu for a person at a terminal, not for piped input
+    interactive = sys.stdin.isatty()
 
     while True:
-        choice = display_menu()
+        try:
+            choice = display_menu() if interactive else input()
+        except EOFError:
+            break
 
         # 1. Import contact from JSON File
         if choice == "1":
@@ -248,15 +713,15 @@ def main():
 
         # 3. Show all ocntact
         elif choice == "3":
-            contacts = manager.get_all_contacts()
-            if contacts:
-                print("\n==== All Contacts ====")
-                for i, contact in enumerate(contacts, 1):
-                    print(f"{i}. Name: {contact['name']}")
-                    print(f"   Email: {contact['email']}")
-                    print(f"   Phone: {contact['phone']}")
-                    print("-------------------")
-            else:
+            i = 0
+            for i, contact in enumerate(manager.get_all_contacts_stream(), 1):
+                if i == 1:
+                    print("\n==== All Contacts ====")
+                print(f"{i}. Name: {contact['name']}")
+                print(f"   Email: {contact['email']}")
+                print(f"   Phone: {contact['phone']}")
+                print("-------------------")
+            if i == 0:
                 print("No contacts found")
 
         # 4. Find a contact
@@ -326,4 +791,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())